@@ -1,8 +1,11 @@
-from src.gui import GeoSightGUI
+from src.gui import GeoSightGUI, configure_logging
 import tkinter as tk
 from tkinter import messagebox
 
 def main():
+    # INFO by default; set GEOSIGHT_LOG=DEBUG for verbose output
+    configure_logging()
+    
     try:
         app = GeoSightGUI()
         app.run()
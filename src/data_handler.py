@@ -1,12 +1,14 @@
 from typing import Dict, Any, Optional, Tuple, List
 import pandas as pd
 import geopandas as gpd
+import shapely
 import folium
 from scipy import stats
+from scipy.spatial import cKDTree
 import matplotlib.pyplot as plt
 import seaborn as sns
 import requests
-from folium.plugins import MarkerCluster
+from folium.plugins import FastMarkerCluster
 import numpy as np
 import unittest
 import pyogrio
@@ -16,13 +18,184 @@ from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut
 import overpy
 import json
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
 from datetime import datetime
+import time
 from timezonefinder import TimezoneFinder
 import logging
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+# How long fetched weather is reused before wttr.in is asked again
+_WEATHER_CACHE_SECONDS = 300
+
+# Amenities plus major buildings around a point, filled in by fetch_city_data
+_OVERPASS_QUERY_TMPL = """
+    [out:json][timeout:25];
+    (
+      // Get important amenities only
+      node["amenity"~"^(restaurant|school|hospital|bank|cafe)$"](around:{radius_m},{lat},{lon});
+      // Get major buildings
+      way["building"]["building"!~"^(shed|garage|roof)$"](around:{radius_m},{lat},{lon});
+    );
+    out center qt 50;  // Limit to 50 results and use quadtile optimization
+"""
+
+def _parse_json(content: bytes) -> Any:
+    """Parse a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _sample_skewness(values: np.ndarray, mean: float) -> float:
+    """Bias-corrected sample skewness of a NaN-free array, matching pandas Series.skew"""
+    n = values.size
+    if n < 3:
+        return float('nan')
+    deviations = values - mean
+    m2 = np.dot(deviations, deviations) / n
+    if m2 == 0:
+        return 0.0
+    m3 = np.dot(deviations * deviations, deviations) / n
+    return float(m3 / m2 ** 1.5 * np.sqrt(n * (n - 1)) / (n - 2))
+
+@lru_cache(maxsize=1024)
+def _geocode_cached(geolocator: Nominatim, query: str) -> Optional[Tuple[float, float]]:
+    """Geocode a normalized query, caching the (lat, lon) result per geolocator"""
+    location = geolocator.geocode(query, timeout=10)
+    if location is None:
+        return None
+    return (location.latitude, location.longitude)
 
-logging.basicConfig(level=logging.DEBUG)
+@lru_cache(maxsize=None)
+def _get_timezone_finder() -> TimezoneFinder:
+    """Return a shared TimezoneFinder, loading its polygon data only once"""
+    return TimezoneFinder()
 
 class GeoAnalyzer:
+    # Marker popup markup, filled in per location by create_visualization
+    _POPUP_TEMPLATE = """
+                    <div style="width: 200px">
+                        <h4>{name}</h4>
+                        <p><b>Type:</b> {attr}</p>
+                        <p><b>Population:</b> {pop}</p>
+                    </div>
+                """
+    
+    # Leaflet callback turning one [lat, lon, popup] row into a red info marker
+    _MARKER_CALLBACK = """
+        function (row) {
+            var icon = L.AwesomeMarkers.icon({
+                markerColor: 'red', iconColor: 'white', icon: 'info-sign', prefix: 'glyphicon'
+            });
+            var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});
+            marker.bindPopup(row[2]);
+            return marker;
+        }
+    """
+    
+    # Stylesheet embedded in every analysis report
+    _CSS_STYLES = """
+        <style>
+            .analysis-container {
+                font-family: 'Helvetica Neue', Arial, sans-serif;
+                max-width: 1200px;
+                margin: 0 auto;
+                padding: 20px;
+                background: #ffffff;
+                box-shadow: 0 0 20px rgba(0,0,0,0.1);
+                border-radius: 8px;
+            }
+            .section {
+                margin: 25px 0;
+                padding: 20px;
+                background: #f8f9fa;
+                border-radius: 6px;
+                border-left: 4px solid #007bff;
+            }
+            .subsection {
+                margin: 15px 0;
+                padding: 15px;
+                background: #ffffff;
+                border-radius: 4px;
+                box-shadow: 0 2px 4px rgba(0,0,0,0.05);
+            }
+            .metric {
+                display: inline-block;
+                margin: 10px;
+                padding: 15px;
+                background: #e9ecef;
+                border-radius: 4px;
+                text-align: center;
+            }
+            .metric-value {
+                font-size: 24px;
+                font-weight: bold;
+                color: #007bff;
+            }
+            .metric-label {
+                font-size: 14px;
+                color: #6c757d;
+            }
+            .chart-container {
+                margin: 20px 0;
+                padding: 15px;
+                background: #ffffff;
+                border-radius: 6px;
+                box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+            }
+            .historical-timeline {
+                margin: 20px 0;
+                padding: 20px;
+                background: #f8f9fa;
+                border-radius: 6px;
+            }
+            .event {
+                margin: 10px 0;
+                padding: 10px;
+                background: #ffffff;
+                border-left: 3px solid #28a745;
+            }
+            .weather-card {
+                background: linear-gradient(135deg, #00a8ff, #0097e6);
+                color: white;
+                padding: 20px;
+                border-radius: 8px;
+                margin: 15px 0;
+            }
+            .alert {
+                padding: 15px;
+                margin: 10px 0;
+                border-radius: 4px;
+                background: #fff3cd;
+                border-left: 4px solid #ffc107;
+            }
+            table {
+                width: 100%;
+                border-collapse: collapse;
+                margin: 15px 0;
+            }
+            th, td {
+                padding: 12px;
+                text-align: left;
+                border-bottom: 1px solid #dee2e6;
+            }
+            th {
+                background: #f8f9fa;
+                font-weight: 600;
+            }
+            .trend-positive {
+                color: #28a745;
+            }
+            .trend-negative {
+                color: #dc3545;
+            }
+        </style>
+    """
+    
     def __init__(self, default_city: str = None, radius_km: float = 2) -> None:
         """
         Initialize GeoAnalyzer
@@ -33,8 +206,18 @@ class GeoAnalyzer:
         """
         self.data: Optional[gpd.GeoDataFrame] = None
         self.map: Optional[folium.Map] = None
+        # Names of numeric columns in self.data, recorded when the data is loaded
+        self.numeric_columns: List[str] = []
+        # Numeric versions of columns, coerced once per dataset
+        self._numeric_cache: Dict[str, pd.Series] = {}
+        # Summary statistics for the current dataset, built on first request
+        self._summary_cache: Optional[Dict[str, Any]] = None
+        # Recent weather keyed by (city, time bucket)
+        self._weather_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
         self.geolocator = Nominatim(user_agent="geosight")
         self.overpass_api = overpy.Overpass()
+        # Shared HTTP session so repeated wttr.in/Wikidata calls reuse connections
+        self.session = requests.Session()
         
         # Only fetch initial data if default_city is provided
         if default_city:
@@ -67,6 +250,8 @@ class GeoAnalyzer:
         """Load geographic data from file or API"""
         try:
             self.data = gpd.read_file(source)
+            self.numeric_columns = self.data.select_dtypes(include=[np.number]).columns.tolist()
+            self._invalidate_caches()
             print(f"Successfully loaded data with {len(self.data)} records")
             # Print available columns for reference
             print("Available columns:", list(self.data.columns))
@@ -75,6 +260,46 @@ class GeoAnalyzer:
             print(f"Error loading data: {e}")
             return False
     
+    def _geocode(self, query: str) -> Optional[Tuple[float, float]]:
+        """Geocode a place name, reusing results for repeated lookups"""
+        return _geocode_cached(self.geolocator, query.strip().lower())
+    
+    def _invalidate_caches(self) -> None:
+        """Drop values derived from self.data after it has been replaced"""
+        self._numeric_cache = {}
+        self._summary_cache = None
+    
+    def get_summary_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get summary statistics for the loaded data, computing them once per dataset
+        
+        Returns:
+            Dictionary with the location count, number of place types and
+            population statistics, or None if no data is loaded
+        """
+        if self.data is None:
+            return None
+        
+        if self._summary_cache is None:
+            population = self.data['population'].agg(['mean', 'median', 'min', 'max', 'std']).to_dict()
+            # Skewness reuses the mean above rather than pandas' separate multi-pass path
+            values = self.data['population'].to_numpy(dtype=float)
+            population['skew'] = _sample_skewness(values[~np.isnan(values)], population['mean'])
+            self._summary_cache = {
+                'count': len(self.data),
+                'place_types': self.data['attributes'].nunique(),
+                'population': population
+            }
+        return self._summary_cache
+    
+    def _numeric_column(self, column_name: str) -> pd.Series:
+        """Return a column coerced to numeric, caching the result until the data changes"""
+        numeric_data = self._numeric_cache.get(column_name)
+        if numeric_data is None:
+            numeric_data = pd.to_numeric(self.data[column_name], errors='coerce')
+            self._numeric_cache[column_name] = numeric_data
+        return numeric_data
+    
     def filter_locations(self, criteria):
         """Filter locations based on criteria"""
         return self.data.query(criteria)
@@ -89,11 +314,25 @@ class GeoAnalyzer:
         Returns:
             Dictionary containing weather data or None if request fails
         """
+        # Reuse weather fetched for the same city within the current time bucket
+        bucket = int(time.time() // _WEATHER_CACHE_SECONDS)
+        key = (city.strip().lower(), bucket)
+        weather = self._weather_cache.get(key)
+        if weather is None:
+            weather = self._fetch_weather_data(city)
+            if weather is not None:
+                # Keep only entries from the current bucket so the cache stays small
+                self._weather_cache = {k: v for k, v in self._weather_cache.items() if k[1] == bucket}
+                self._weather_cache[key] = weather
+        return weather
+    
+    def _fetch_weather_data(self, city: str) -> Optional[Dict[str, Any]]:
+        """Request current weather for a city from wttr.in"""
         url = f"https://wttr.in/{city}?format=j1"
         try:
-            response = requests.get(url, timeout=10)  # Add timeout for safety
+            response = self.session.get(url, timeout=10)  # Add timeout for safety
             if response.status_code == 200:
-                weather_data = response.json()
+                weather_data = _parse_json(response.content)
                 return {
                     'temperature': weather_data['current_condition'][0]['temp_C'],
                     'humidity': weather_data['current_condition'][0]['humidity'],
@@ -125,21 +364,20 @@ class GeoAnalyzer:
                 tiles='OpenStreetMap'
             )
 
-            # Add markers
-            for _, row in filtered_data.iterrows():
-                popup_content = f"""
-                    <div style="width: 200px">
-                        <h4>{row['name']}</h4>
-                        <p><b>Type:</b> {row['attributes']}</p>
-                        <p><b>Population:</b> {row['population']}</p>
-                    </div>
-                """
-                
-                folium.Marker(
-                    location=[row.geometry.y, row.geometry.x],
-                    popup=popup_content,
-                    icon=folium.Icon(color='red', icon='info-sign')
-                ).add_to(m)
+            # Pull raw arrays once instead of boxing every row with iterrows()
+            xs = filtered_data.geometry.x.to_numpy()
+            ys = filtered_data.geometry.y.to_numpy()
+            names = filtered_data['name'].to_numpy()
+            attrs = filtered_data['attributes'].to_numpy()
+            pops = filtered_data['population'].to_numpy()
+
+            # Ship the markers as one JSON array and build them in the browser,
+            # instead of rendering a Marker/Icon/Popup template per location
+            marker_data = [
+                [y, x, self._POPUP_TEMPLATE.format(name=name, attr=attr, pop=pop)]
+                for x, y, name, attr, pop in zip(xs.tolist(), ys.tolist(), names, attrs, pops.tolist())
+            ]
+            FastMarkerCluster(marker_data, callback=self._MARKER_CALLBACK).add_to(m)
 
             return m
 
@@ -175,7 +413,7 @@ class GeoAnalyzer:
             correlation_column: Optional column to correlate against
         """
         # Convert data to numeric, dropping non-numeric values
-        plot_data = pd.to_numeric(self.data[column_name], errors='coerce')
+        plot_data = self._numeric_column(column_name)
         
         # Create a figure with multiple subplots
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 5))
@@ -210,31 +448,39 @@ class GeoAnalyzer:
                 print("No data available for analysis")
                 return None
             
-            # Create map visualization first
-            self.map = self.create_visualization(self.data, self.get_weather_data(location))
-            
-            # Verify and prepare data
-            numeric_data = pd.to_numeric(self.data[column_name], errors='coerce')
-            numeric_data_clean = numeric_data.dropna()
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Fetch weather in the background while the statistics and plots are built
+                weather_future = executor.submit(self.get_weather_data, location)
+                
+                # Verify and prepare data
+                numeric_data = self._numeric_column(column_name)
+                numeric_data_clean = numeric_data.dropna()
+                
+                # Basic statistics
+                summary = numeric_data.agg(['mean', 'median', 'std', 'var', 'min', 'max'])
+                basic_stats = {
+                    'count': int(len(numeric_data)),
+                    'mean': float(summary['mean']),
+                    'median': float(summary['median']),
+                    'mode': float(stats.mode(numeric_data_clean)[0]),
+                    'std_dev': float(summary['std']),
+                    'variance': float(summary['var']),
+                    'min': float(summary['min']),
+                    'max': float(summary['max'])
+                }
+                
+                visualizations = self.create_plots(column_name)
+                weather = weather_future.result()
             
-            # Basic statistics
-            basic_stats = {
-                'count': int(len(numeric_data)),
-                'mean': float(numeric_data.mean()),
-                'median': float(numeric_data.median()),
-                'mode': float(stats.mode(numeric_data_clean)[0]),
-                'std_dev': float(numeric_data.std()),
-                'variance': float(numeric_data.var()),
-                'min': float(numeric_data.min()),
-                'max': float(numeric_data.max())
-            }
+            # Create map visualization
+            self.map = self.create_visualization(self.data, weather)
             
             # Create analysis result
             analysis = {
                 'basic_stats': basic_stats,
                 'map': self.map,  # Include the map in the analysis results
-                'visualizations': self.create_plots(column_name),
-                'weather': self.get_weather_data(location)
+                'visualizations': visualizations,
+                'weather': weather
             }
             
             return analysis
@@ -258,20 +504,24 @@ class GeoAnalyzer:
     
     def _perform_outlier_analysis(self, data):
         """Perform comprehensive outlier analysis"""
-        z_scores = stats.zscore(data)
-        iqr = stats.iqr(data)
-        q1 = np.percentile(data, 25)
-        q3 = np.percentile(data, 75)
+        values = np.asarray(data, dtype=float)
+        
+        # Compute each mask once and reuse it for the indices and the summary counts
+        z_scores = stats.zscore(values)
+        z_score_outliers = np.flatnonzero(np.abs(z_scores) > 3)
+        q1, q3 = np.percentile(values, [25, 75])
+        iqr = q3 - q1
+        iqr_outliers = np.flatnonzero((values < (q1 - 1.5 * iqr)) | 
+                                      (values > (q3 + 1.5 * iqr)))
         
         return {
-            'z_score_outliers': np.where(np.abs(z_scores) > 3)[0],
-            'iqr_outliers': np.where((data < (q1 - 1.5 * iqr)) | 
-                                    (data > (q3 + 1.5 * iqr)))[0],
+            'z_score_outliers': z_score_outliers,
+            'iqr_outliers': iqr_outliers,
             'isolation_forest': self._isolation_forest_outliers(data),
             'local_outlier_factor': self._local_outlier_factor(data),
             'outlier_statistics': {
-                'total_outliers': len(np.where(np.abs(z_scores) > 3)[0]),
-                'percentage_outliers': len(np.where(np.abs(z_scores) > 3)[0]) / len(data) * 100,
+                'total_outliers': len(z_score_outliers),
+                'percentage_outliers': len(z_score_outliers) / len(values) * 100,
                 'outlier_impact': self._calculate_outlier_impact(data)
             }
         }
@@ -306,51 +556,44 @@ class GeoAnalyzer:
             print(f"Fetching data for {city_name} with radius {radius_km}km...")
             
             # Get city coordinates
-            location = self.geolocator.geocode(city_name, timeout=10)
-            if not location:
+            coordinates = self._geocode(city_name)
+            if not coordinates:
                 print(f"Could not find coordinates for {city_name}")
                 return False
+            lat, lon = coordinates
 
             # Create more efficient Overpass query
             radius_m = radius_km * 1000
-            query = f"""
-                [out:json][timeout:25];
-                (
-                  // Get important amenities only
-                  node["amenity"~"^(restaurant|school|hospital|bank|cafe)$"](around:{radius_m},{location.latitude},{location.longitude});
-                  // Get major buildings
-                  way["building"]["building"!~"^(shed|garage|roof)$"](around:{radius_m},{location.latitude},{location.longitude});
-                );
-                out center qt 50;  // Limit to 50 results and use quadtile optimization
-            """
+            query = _OVERPASS_QUERY_TMPL.format(radius_m=radius_m, lat=lat, lon=lon)
 
             # Execute query
             result = self.overpass_api.query(query)
             
-            # Convert to GeoJSON format
-            features = []
-            
-            # Process nodes (amenities)
-            for node in result.nodes:
-                features.append({
-                    "type": "Feature",
-                    "properties": {
-                        "name": node.tags.get('name', f'Location {node.id}'),
-                        "attributes": node.tags.get('amenity', 'building'),
-                        "population": int(np.random.randint(100, 1000))
-                    },
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [float(node.lon), float(node.lat)]
-                    }
-                })
-
-            if not features:
+            nodes = result.nodes
+            if not nodes:
                 print("No features found in the area")
                 return False
 
-            # Convert to GeoDataFrame
-            self.data = gpd.GeoDataFrame.from_features(features)
+            # Collect node (amenity) attributes as parallel columns
+            names = [node.tags.get('name', f'Location {node.id}') for node in nodes]
+            attributes = [node.tags.get('amenity', 'building') for node in nodes]
+            lons = np.array([node.lon for node in nodes], dtype=float)
+            lats = np.array([node.lat for node in nodes], dtype=float)
+            populations = np.random.randint(100, 1000, size=len(nodes), dtype=np.int32)
+
+            # Convert to GeoDataFrame, building all point geometries in one bulk GEOS call
+            self.data = gpd.GeoDataFrame(
+                {
+                    'name': names,
+                    # Small, repeated tag set, so store it as categorical codes
+                    'attributes': pd.Categorical(attributes),
+                    'population': populations
+                },
+                geometry=shapely.points(lons, lats),
+                crs='EPSG:4326'
+            )
+            self.numeric_columns = ['population']
+            self._invalidate_caches()
             print(f"Successfully loaded {len(self.data)} locations")
             return True
 
@@ -379,9 +622,9 @@ class GeoAnalyzer:
                     'language': 'en',
                     'search': location
                 }
-                response = requests.get(wiki_url, params=params)
+                response = self.session.get(wiki_url, params=params)
                 if response.status_code == 200:
-                    data = response.json()
+                    data = _parse_json(response.content)
                     if data.get('search'):
                         history_data['foundation_date'] = data['search'][0].get('description', 'Unknown')
             except Exception as e:
@@ -409,19 +652,19 @@ class GeoAnalyzer:
             # Calculate center of mass
             if 'geometry' in self.data.columns:
                 centroids = self.data.geometry.centroid
-                center_x = centroids.x.mean()
-                center_y = centroids.y.mean()
+                coords = np.column_stack([centroids.x.to_numpy(), centroids.y.to_numpy()])
+                center_x, center_y = coords.mean(axis=0)
                 spatial_analysis['center_of_mass'] = (center_x, center_y)
-            
-            # Analyze distribution pattern
-            if len(self.data) > 1:
-                nearest_neighbor = self.data.geometry.distance(self.data.geometry.shift())
-                mean_distance = nearest_neighbor.mean()
-                spatial_analysis['distribution_pattern'] = (
-                    'Clustered' if mean_distance < 0.1 else
-                    'Dispersed' if mean_distance > 1 else
-                    'Random'
-                )
+                
+                # Analyze distribution pattern from true nearest-neighbor distances
+                if len(coords) > 1:
+                    distances, _ = cKDTree(coords).query(coords, k=2)
+                    mean_distance = distances[:, 1].mean()
+                    spatial_analysis['distribution_pattern'] = (
+                        'Clustered' if mean_distance < 0.1 else
+                        'Dispersed' if mean_distance > 1 else
+                        'Random'
+                    )
             
             return spatial_analysis
         except Exception as e:
@@ -463,8 +706,15 @@ class GeoAnalyzer:
             
             # Use population data from our dataset if available
             if self.data is not None and 'population' in self.data.columns:
-                demographic_data['current_population'] = self.data['population'].sum()
-                if 'geometry' in self.data.columns:
+                population = self.data['population']
+                if pd.api.types.is_integer_dtype(population.dtype) and not population.hasnans:
+                    # Widen integer counts so int32 totals can't overflow
+                    demographic_data['current_population'] = population.to_numpy(dtype=np.int64).sum()
+                else:
+                    # Float columns keep their fractions; missing values are skipped
+                    demographic_data['current_population'] = population.sum()
+                # Points have no area, so skip the per-geometry area computation for them
+                if 'geometry' in self.data.columns and not (self.data.geom_type == 'Point').all():
                     area = self.data.geometry.area.sum()
                     if area > 0:
                         demographic_data['population_density'] = demographic_data['current_population'] / area
@@ -483,10 +733,9 @@ class GeoAnalyzer:
                 return (center_point.y, center_point.x)
             
             # Fallback to geocoding if no data available
-            geolocator = Nominatim(user_agent="satellite_analyzer")
-            location_data = geolocator.geocode(location)
-            if location_data:
-                return (location_data.latitude, location_data.longitude)
+            coordinates = self._geocode(location)
+            if coordinates:
+                return coordinates
             return (0, 0)
         except Exception as e:
             print(f"Error getting coordinates: {e}")
@@ -496,7 +745,7 @@ class GeoAnalyzer:
         """Get timezone for a location"""
         try:
             coordinates = self._get_coordinates(location)
-            tf = TimezoneFinder()
+            tf = _get_timezone_finder()
             timezone_str = tf.timezone_at(lat=coordinates[0], lng=coordinates[1])
             return timezone_str or "Unknown"
         except Exception as e:
@@ -523,110 +772,12 @@ class GeoAnalyzer:
         Returns:
             str: Formatted HTML string containing the analysis report
         """
-        css_styles = """
-            <style>
-                .analysis-container {
-                    font-family: 'Helvetica Neue', Arial, sans-serif;
-                    max-width: 1200px;
-                    margin: 0 auto;
-                    padding: 20px;
-                    background: #ffffff;
-                    box-shadow: 0 0 20px rgba(0,0,0,0.1);
-                    border-radius: 8px;
-                }
-                .section {
-                    margin: 25px 0;
-                    padding: 20px;
-                    background: #f8f9fa;
-                    border-radius: 6px;
-                    border-left: 4px solid #007bff;
-                }
-                .subsection {
-                    margin: 15px 0;
-                    padding: 15px;
-                    background: #ffffff;
-                    border-radius: 4px;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-                }
-                .metric {
-                    display: inline-block;
-                    margin: 10px;
-                    padding: 15px;
-                    background: #e9ecef;
-                    border-radius: 4px;
-                    text-align: center;
-                }
-                .metric-value {
-                    font-size: 24px;
-                    font-weight: bold;
-                    color: #007bff;
-                }
-                .metric-label {
-                    font-size: 14px;
-                    color: #6c757d;
-                }
-                .chart-container {
-                    margin: 20px 0;
-                    padding: 15px;
-                    background: #ffffff;
-                    border-radius: 6px;
-                    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-                }
-                .historical-timeline {
-                    margin: 20px 0;
-                    padding: 20px;
-                    background: #f8f9fa;
-                    border-radius: 6px;
-                }
-                .event {
-                    margin: 10px 0;
-                    padding: 10px;
-                    background: #ffffff;
-                    border-left: 3px solid #28a745;
-                }
-                .weather-card {
-                    background: linear-gradient(135deg, #00a8ff, #0097e6);
-                    color: white;
-                    padding: 20px;
-                    border-radius: 8px;
-                    margin: 15px 0;
-                }
-                .alert {
-                    padding: 15px;
-                    margin: 10px 0;
-                    border-radius: 4px;
-                    background: #fff3cd;
-                    border-left: 4px solid #ffc107;
-                }
-                table {
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin: 15px 0;
-                }
-                th, td {
-                    padding: 12px;
-                    text-align: left;
-                    border-bottom: 1px solid #dee2e6;
-                }
-                th {
-                    background: #f8f9fa;
-                    font-weight: 600;
-                }
-                .trend-positive {
-                    color: #28a745;
-                }
-                .trend-negative {
-                    color: #dc3545;
-                }
-            </style>
-        """
-
         html_content = f"""
             <!DOCTYPE html>
             <html>
             <head>
                 <title>City Analysis Report: {analysis_data['metadata']['location']}</title>
-                {css_styles}
+                {self._CSS_STYLES}
             </head>
             <body>
                 <div class="analysis-container">
@@ -734,6 +885,7 @@ class TestGeoAnalyzer(unittest.TestCase):
 
 # Example usage (now with better error handling)
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     analyzer = GeoAnalyzer(radius_km=1)  # Smaller radius
     
     if analyzer.data is not None:
@@ -3,19 +3,77 @@ from .data_handler import GeoAnalyzer
 import tkinter as tk
 from tkinter import messagebox
 import webbrowser
-import folium
 import tempfile
 import os
+import atexit
 import logging
-from datetime import datetime
-from scipy import stats
-import numpy as np
+import threading
+from string import Template
+
+# Popular cities for the quick select dropdown
+CITIES = {
+    "Select a city": None,
+    "New York, USA": (40.7128, -74.0060),
+    "London, UK": (51.5074, -0.1278),
+    "Tokyo, Japan": (35.6762, 139.6503),
+    "Paris, France": (48.8566, 2.3522),
+    "Sydney, Australia": (-33.8688, 151.2093),
+    "Dubai, UAE": (25.2048, 55.2708),
+    "Singapore": (1.3521, 103.8198),
+    "Hong Kong": (22.3193, 114.1694),
+    "Mumbai, India": (19.0760, 72.8777),
+    "Rio de Janeiro, Brazil": (-22.9068, -43.1729)
+}
+CITY_NAMES = tuple(CITIES)
+
+def configure_logging():
+    """Configure root logging from GEOSIGHT_LOG, falling back to INFO on unknown names"""
+    name = os.environ.get("GEOSIGHT_LOG", "INFO").upper()
+    level = getattr(logging, name, logging.INFO)
+    if not isinstance(level, int):
+        level = logging.INFO
+    logging.basicConfig(level=level)
+
+# Analysis report sections, built once at import and filled in per analysis
+_SECTION_RULE = "-" * 20
+_SUMMARY_TMPL = Template(
+    " Analysis Results\n"
+    + "=" * 40 + "\n\n"
+    "📍 Location Information\n"
+    + _SECTION_RULE + "\n"
+    "• Analyzing: ${location}\n"
+    "• Total Locations: ${total}\n"
+    "• Types of Places: ${place_types}\n\n"
+    "👥 Population Statistics\n"
+    + _SECTION_RULE + "\n"
+    "• Average: ${mean}\n"
+    "• Median: ${median}\n"
+    "• Range: ${min} - ${max}\n"
+    "• Standard Deviation: ${std}\n\n"
+    "📈 Distribution Analysis\n"
+    + _SECTION_RULE + "\n"
+    "• Skewness: ${skewness} (${skew_label})\n"
+)
+_WEATHER_TMPL = Template(
+    "\n🌡️ Weather Conditions\n"
+    + _SECTION_RULE + "\n"
+    "• Temperature: ${temperature}°C\n"
+    "• Feels Like: ${feels_like}°C\n"
+    "• Conditions: ${description}\n"
+    "• Humidity: ${humidity}%\n"
+    "• Wind Speed: ${wind_speed} km/h\n"
+)
+_QUALITY_TMPL = Template(
+    "\n📋 Data Quality\n"
+    + _SECTION_RULE + "\n"
+    "• ${coverage}\n"
+    "• Sample Size: ${total} locations\n"
+)
 
 class GeoSightGUI:
     def __init__(self):
-        # Add logger initialization
+        # Add logger initialization (logging itself is configured by the entry point)
         self.logger = logging.getLogger(__name__)
-        logging.basicConfig(level=logging.DEBUG)
         
         # Configure window
         self.window = ctk.CTk()
@@ -28,7 +86,10 @@ class GeoSightGUI:
         # Create main frame and GUI
         self.setup_gui()
         
-        self.map_file = None
+        # One private map file per session (unpredictable name), overwritten by each analysis
+        fd, self.map_file = tempfile.mkstemp(prefix="geosight_", suffix=".html")
+        os.close(fd)
+        self.is_busy = False
     
     def setup_gui(self):
         """Setup the main GUI elements"""
@@ -54,21 +115,6 @@ class GeoSightGUI:
         self.results_frame = ctk.CTkFrame(self.main_frame)
         self.results_frame.pack(fill="both", expand=True, padx=10, pady=5)
         
-        # List of popular cities
-        self.cities = {
-            "Select a city": None,
-            "New York, USA": (40.7128, -74.0060),
-            "London, UK": (51.5074, -0.1278),
-            "Tokyo, Japan": (35.6762, 139.6503),
-            "Paris, France": (48.8566, 2.3522),
-            "Sydney, Australia": (-33.8688, 151.2093),
-            "Dubai, UAE": (25.2048, 55.2708),
-            "Singapore": (1.3521, 103.8198),
-            "Hong Kong": (22.3193, 114.1694),
-            "Mumbai, India": (19.0760, 72.8777),
-            "Rio de Janeiro, Brazil": (-22.9068, -43.1729)
-        }
-        
         # Setup quick select dropdown
         self.quick_select_frame = ctk.CTkFrame(self.search_frame)
         self.quick_select_frame.pack(side="left", padx=5)
@@ -82,7 +128,7 @@ class GeoSightGUI:
         self.city_var = tk.StringVar(value="Select a city")
         self.city_dropdown = ctk.CTkOptionMenu(
             self.quick_select_frame,
-            values=list(self.cities.keys()),
+            values=CITY_NAMES,
             variable=self.city_var,
             command=self.on_city_select
         )
@@ -154,6 +200,9 @@ class GeoSightGUI:
         )
         self.stats_text.pack(fill="both", expand=True, padx=10, pady=10)
         
+        # Progress bar, only packed while a background task is running
+        self.progress_bar = ctk.CTkProgressBar(self.results_frame, mode="indeterminate")
+        
         # Map view button
         self.view_map_button = ctk.CTkButton(
             self.results_frame,
@@ -163,7 +212,14 @@ class GeoSightGUI:
         self.view_map_button.pack(pady=5)
         
         # Initial message
-        self.stats_text.insert("1.0", "Welcome to GeoSight!\n\nEnter a city name and radius, then click 'Fetch Data' to begin.")
+        self._set_stats_text("Welcome to GeoSight!\n\nEnter a city name and radius, then click 'Fetch Data' to begin.")
+    
+    def _set_stats_text(self, text):
+        """Replace the results text in a single batched, read-only update"""
+        self.stats_text.configure(state="normal")
+        self.stats_text.delete("1.0", tk.END)
+        self.stats_text.insert("1.0", text)
+        self.stats_text.configure(state="disabled")
     
     def on_city_select(self, city):
         """Handle city selection from dropdown"""
@@ -175,96 +231,134 @@ class GeoSightGUI:
             # Auto-fetch data for the selected city
             self.fetch_city_data()
     
-    def run_analysis(self):
-        """Run the comprehensive analysis"""
-        try:
-            if not self.analyzer or self.analyzer.data is None:
-                messagebox.showerror("Error", "No data available. Please fetch city data first.")
-                return
+    def run_analysis(self, location=None):
+        """
+        Run the comprehensive analysis
+        
+        Args:
+            location: City to label the analysis with; defaults to the search entry
+        """
+        if self.is_busy:
+            return
 
+        if not self.analyzer or self.analyzer.data is None:
+            messagebox.showerror("Error", "No data available. Please fetch city data first.")
+            return
+
+        if location is None:
             location = self.city_entry.get()
-            if not location:
-                messagebox.showerror("Error", "Please enter a city name")
-                return
+        if not location:
+            messagebox.showerror("Error", "Please enter a city name")
+            return
 
-            # Show loading message
-            self.stats_text.delete("1.0", tk.END)
-            self.stats_text.insert("1.0", "Analyzing data...\nPlease wait...")
-            self.window.update()
+        # Show loading message and hand the heavy lifting to a worker thread
+        self._start_busy("Analyzing data...\nPlease wait...")
+        threading.Thread(target=self._analysis_worker, args=(location,), daemon=True).start()
+
+    def _analysis_worker(self, location):
+        """Build the map and statistics report off the Tk main thread"""
+        try:
+            # Bind the analyzer and its data once; the worker reads them repeatedly
+            analyzer = self.analyzer
+            df = analyzer.data
 
             # Create visualization
-            map_obj = self.analyzer.create_visualization(self.analyzer.data)
-            if map_obj:
-                # Save map
-                self.map_file = os.path.abspath('interactive_map.html')
-                map_obj.save(self.map_file)
-                print(f"Map saved to: {self.map_file}")
+            map_obj = analyzer.create_visualization(df)
+            if not map_obj:
+                self.window.after(0, self._on_task_failed, "Failed to create visualization")
+                return
 
-                # Display statistics
-                stats_text = " Analysis Results\n"
-                stats_text += "=" * 40 + "\n\n"
-                
-                # Location Information
-                stats_text += "📍 Location Information\n"
-                stats_text += "-" * 20 + "\n"
-                stats_text += f"• Analyzing: {location}\n"
-                stats_text += f"• Total Locations: {len(self.analyzer.data)}\n"
-                stats_text += f"• Types of Places: {self.analyzer.data['attributes'].nunique()}\n\n"
-                
-                # Population Statistics
-                pop_stats = self.analyzer.data['population'].describe()
-                stats_text += "👥 Population Statistics\n"
-                stats_text += "-" * 20 + "\n"
-                stats_text += f"• Average: {pop_stats['mean']:,.0f}\n"
-                stats_text += f"• Median: {pop_stats['50%']:,.0f}\n"
-                stats_text += f"• Range: {pop_stats['min']:,.0f} - {pop_stats['max']:,.0f}\n"
-                stats_text += f"• Standard Deviation: {pop_stats['std']:,.0f}\n\n"
-                
-                # Distribution Analysis
-                stats_text += "📈 Distribution Analysis\n"
-                stats_text += "-" * 20 + "\n"
-                skewness = self.analyzer.data['population'].skew()
-                stats_text += f"• Skewness: {skewness:.2f} "
-                if skewness > 1:
-                    stats_text += "(Highly right-skewed)\n"
-                elif skewness < -1:
-                    stats_text += "(Highly left-skewed)\n"
-                else:
-                    stats_text += "(Approximately symmetric)\n"
-                
-                # Get weather data
-                weather = self.analyzer.get_weather_data(location)
-                if weather:
-                    stats_text += "\n🌡️ Weather Conditions\n"
-                    stats_text += "-" * 20 + "\n"
-                    stats_text += f"• Temperature: {weather.get('temperature', 'N/A')}°C\n"
-                    stats_text += f"• Feels Like: {weather.get('feels_like', 'N/A')}°C\n"
-                    stats_text += f"• Conditions: {weather.get('description', 'N/A')}\n"
-                    stats_text += f"• Humidity: {weather.get('humidity', 'N/A')}%\n"
-                    stats_text += f"• Wind Speed: {weather.get('wind_speed', 'N/A')} km/h\n"
-                
-                # Data Quality
-                stats_text += "\n📋 Data Quality\n"
-                stats_text += "-" * 20 + "\n"
-                quality_score = len(self.analyzer.data)
-                if quality_score > 100:
-                    stats_text += "• Excellent data coverage\n"
-                elif quality_score > 50:
-                    stats_text += "• Good data coverage\n"
-                else:
-                    stats_text += "• Limited data coverage\n"
-                stats_text += f"• Sample Size: {quality_score} locations\n"
+            # Save map
+            map_obj.save(self.map_file)
+            print(f"Map saved to: {self.map_file}")
 
-                self.stats_text.delete("1.0", tk.END)
-                self.stats_text.insert("1.0", stats_text)
+            # Summary statistics are computed once per fetched dataset
+            summary = analyzer.get_summary_stats()
+            pop_stats = summary['population']
+            skewness = pop_stats['skew']
+            if skewness > 1:
+                skew_label = "Highly right-skewed"
+            elif skewness < -1:
+                skew_label = "Highly left-skewed"
+            else:
+                skew_label = "Approximately symmetric"
 
-                messagebox.showinfo("Success", "Analysis completed! Click 'View Map' to see the visualization.")
+            quality_score = summary['count']
+            if quality_score > 100:
+                coverage = "Excellent data coverage"
+            elif quality_score > 50:
+                coverage = "Good data coverage"
             else:
-                messagebox.showerror("Error", "Failed to create visualization")
+                coverage = "Limited data coverage"
+
+            # Display statistics
+            parts = [
+                _SUMMARY_TMPL.substitute(
+                    location=location,
+                    total=quality_score,
+                    place_types=summary['place_types'],
+                    mean=f"{pop_stats['mean']:,.0f}",
+                    median=f"{pop_stats['median']:,.0f}",
+                    min=f"{pop_stats['min']:,.0f}",
+                    max=f"{pop_stats['max']:,.0f}",
+                    std=f"{pop_stats['std']:,.0f}",
+                    skewness=f"{skewness:.2f}",
+                    skew_label=skew_label
+                )
+            ]
+            
+            # Get weather data
+            weather = analyzer.get_weather_data(location)
+            if weather:
+                parts.append(_WEATHER_TMPL.substitute(
+                    temperature=weather.get('temperature', 'N/A'),
+                    feels_like=weather.get('feels_like', 'N/A'),
+                    description=weather.get('description', 'N/A'),
+                    humidity=weather.get('humidity', 'N/A'),
+                    wind_speed=weather.get('wind_speed', 'N/A')
+                ))
+            
+            # Data Quality
+            parts.append(_QUALITY_TMPL.substitute(coverage=coverage, total=quality_score))
+            stats_text = "".join(parts)
+
+            self.window.after(0, self._on_analysis_done, stats_text)
 
         except Exception as e:
             print(f"Error in analysis: {e}")
-            messagebox.showerror("Error", f"Analysis failed: {str(e)}")
+            self.window.after(0, self._on_task_failed, f"Analysis failed: {str(e)}")
+
+    def _on_analysis_done(self, stats_text):
+        """Show the finished analysis report (runs on the Tk main thread)"""
+        self._stop_busy()
+        self._set_stats_text(stats_text)
+
+        messagebox.showinfo("Success", "Analysis completed! Click 'View Map' to see the visualization.")
+
+    def _on_task_failed(self, message):
+        """Report a failed background task (runs on the Tk main thread)"""
+        self._stop_busy()
+        messagebox.showerror("Error", message)
+
+    def _start_busy(self, message):
+        """Show a loading message and progress bar, and lock the input controls"""
+        self.is_busy = True
+        self._set_stats_text(message)
+        self._set_inputs_state("disabled")
+        self.progress_bar.pack(fill="x", padx=10, pady=(0, 5), before=self.view_map_button)
+        self.progress_bar.start()
+
+    def _stop_busy(self):
+        """Hide the progress bar and unlock the input controls"""
+        self.is_busy = False
+        self.progress_bar.stop()
+        self.progress_bar.pack_forget()
+        self._set_inputs_state("normal")
+
+    def _set_inputs_state(self, state):
+        """Enable or disable every control that can start or retarget a task"""
+        for widget in (self.fetch_button, self.analyze_button, self.city_dropdown, self.city_entry):
+            widget.configure(state=state)
 
     def _get_data_quality_status(self, stats):
         """Helper method to determine geographic data quality"""
@@ -299,8 +393,9 @@ class GeoSightGUI:
     def view_map(self):
         """Open the interactive map in default web browser"""
         try:
-            map_path = os.path.abspath('interactive_map.html')
-            if os.path.exists(map_path):
+            map_path = self.map_file
+            # The file is created empty up front, so only a non-empty one holds a map
+            if os.path.exists(map_path) and os.path.getsize(map_path) > 0:
                 print(f"Opening map: {map_path}")
                 webbrowser.open(f'file:///{map_path}')
             else:
@@ -311,89 +406,97 @@ class GeoSightGUI:
     
     def fetch_city_data(self):
         """Fetch data for the specified city"""
+        if self.is_busy:
+            return
+
         try:
             city = self.city_entry.get()
             radius = float(self.radius_entry.get())
-            
-            if not city:
-                messagebox.showerror("Error", "Please enter a city name")
-                return
-            
-            # Show loading message
-            self.stats_text.delete("1.0", tk.END)
-            self.stats_text.insert("1.0", f"Fetching data for {city}...\nThis may take a few moments...")
-            self.window.update()
-            
-            # Fetch the data
-            success = self.analyzer.fetch_city_data(city, radius)
-            
-            if success:
-                # Update available columns for analysis
-                self.update_column_menu()
-                
-                # Update location entry for analysis
-                self.location_entry.delete(0, tk.END)
-                self.location_entry.insert(0, city)
-                
-                # Run initial analysis
-                self.run_analysis()
-                
-                messagebox.showinfo("Success", f"Successfully fetched and analyzed data for {city}")
-            else:
-                messagebox.showerror("Error", f"Failed to fetch data for {city}")
-        
         except ValueError as e:
             messagebox.showerror("Error", "Please enter a valid radius (number)")
+            return
+        
+        if not city:
+            messagebox.showerror("Error", "Please enter a city name")
+            return
+        
+        # Show loading message and fetch on a worker thread so the window stays responsive
+        self._start_busy(f"Fetching data for {city}...\nThis may take a few moments...")
+        threading.Thread(target=self._fetch_worker, args=(city, radius), daemon=True).start()
+    
+    def _fetch_worker(self, city, radius):
+        """Fetch city data off the Tk main thread"""
+        try:
+            success = self.analyzer.fetch_city_data(city, radius)
+            if success:
+                # Compute the summary here so later analyses just read it
+                self.analyzer.get_summary_stats()
         except Exception as e:
             self.logger.error(f"Error in fetch_city_data: {str(e)}")
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            self.window.after(0, self._on_task_failed, f"An error occurred: {str(e)}")
+            return
+        
+        self.window.after(0, self._on_fetch_done, city, success)
+    
+    def _on_fetch_done(self, city, success):
+        """Update the GUI once a fetch finishes (runs on the Tk main thread)"""
+        self._stop_busy()
+        
+        if success:
+            # Update available columns for analysis
+            self.update_column_menu()
+            
+            # Update location entry for analysis
+            self.location_entry.delete(0, tk.END)
+            self.location_entry.insert(0, city)
+            
+            # Run initial analysis for the city that was actually fetched
+            self.run_analysis(location=city)
+            
+            messagebox.showinfo("Success", f"Successfully fetched data for {city}")
+        else:
+            messagebox.showerror("Error", f"Failed to fetch data for {city}")
     
     def run(self):
         """Start the GUI application"""
+        self.window.protocol("WM_DELETE_WINDOW", self._on_close)
+        # Make sure the map file is removed even if the window never closes cleanly
+        atexit.register(self._cleanup_map_file)
+        
         try:
-            # Add a flag to track if the application is running
-            self.is_running = True
-            
-            while self.is_running:
-                try:
-                    # Check if window exists and isn't destroyed
-                    if self.window and hasattr(self.window, '_w'):
-                        self.window.update()
-                    else:
-                        self.is_running = False
-                        break
-                except tk.TclError:
-                    # Window was destroyed
-                    self.is_running = False
-                    self.logger.info("Application interrupted by user")
-                    break
-                
+            self.window.mainloop()
         except Exception as e:
             self.logger.error(f"Application error: {e}")
         finally:
-            # Cleanup
-            if hasattr(self, 'window') and self.window:
-                try:
-                    self.window.destroy()
-                except:
-                    pass
-            
-            # Cleanup map file if it exists
-            if self.map_file and os.path.exists(self.map_file):
-                try:
-                    os.remove(self.map_file)
-                except Exception as e:
-                    self.logger.error(f"Failed to cleanup map file: {str(e)}")
+            self._cleanup_map_file()
+    
+    def _on_close(self):
+        """Clean up and destroy the window when the user closes it"""
+        self.logger.info("Application closed by user")
+        self._cleanup_map_file()
+        try:
+            self.window.destroy()
+        except tk.TclError:
+            pass
+    
+    def _cleanup_map_file(self):
+        """Remove the saved map file if it exists"""
+        if self.map_file and os.path.exists(self.map_file):
+            try:
+                os.remove(self.map_file)
+            except Exception as e:
+                self.logger.error(f"Failed to cleanup map file: {str(e)}")
 
     def update_column_menu(self):
         """Update the column menu with available columns from the data"""
         try:
-            if self.analyzer and self.analyzer.data is not None:
-                # Get available numeric columns
-                numeric_columns = self.analyzer.data.select_dtypes(include=[np.number]).columns.tolist()
+            analyzer = self.analyzer
+            if analyzer and analyzer.data is not None:
+                # Get available numeric columns, as recorded by the analyzer when it loaded the data
+                numeric_columns = list(analyzer.numeric_columns)
                 
                 # Always ensure 'population' is in the list if available
-                if 'population' in self.analyzer.data.columns and 'population' not in numeric_columns:
+                if 'population' in analyzer.data.columns and 'population' not in numeric_columns:
                     numeric_columns.append('population')
                 
                 # Update the menu with available columns
@@ -415,5 +518,6 @@ class GeoSightGUI:
             self.column_var.set('population')
 
 if __name__ == "__main__":
+    configure_logging()
     app = GeoSightGUI()
     app.run() 
\ No newline at end of file
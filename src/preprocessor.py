@@ -15,21 +15,56 @@ class SatellitePreprocessor:
         Returns:
             numpy.ndarray: Normalized data
         """
-        return (data - np.min(data)) / (np.max(data) - np.min(data))
+        data_min = np.min(data)
+        data_range = np.max(data) - data_min
+        
+        # Subtract into a single output buffer and divide in place to avoid temporaries
+        out_dtype = data.dtype if np.issubdtype(data.dtype, np.floating) else np.float64
+        normalized = np.subtract(data, data_min, dtype=out_dtype)
+        normalized /= data_range
+        return normalized
     
     @staticmethod
-    def remove_noise(data: np.ndarray, threshold: Optional[float] = None) -> np.ndarray:
+    def remove_noise(data: np.ndarray, threshold: Optional[float] = None,
+                     inplace: bool = False) -> np.ndarray:
         """
         Basic noise reduction using threshold filtering.
         
         Args:
             data: Input satellite data array
             threshold: Optional threshold value for noise removal
+            inplace: Zero values in ``data`` itself instead of a copy
             
         Returns:
             numpy.ndarray: Filtered data
         """
         if threshold is None:
-            threshold = np.mean(data) - 2 * np.std(data)
+            # Reuse the mean for the deviation instead of letting np.std recompute it;
+            # vdot reduces the squared deviations without another temporary
+            mean = np.mean(data)
+            deviations = np.subtract(data, mean, dtype=np.float64)
+            std = np.sqrt(np.vdot(deviations, deviations) / deviations.size)
+            threshold = mean - 2 * std
+        
+        filtered = data if inplace else data.copy()
+        np.putmask(filtered, filtered < threshold, 0)
+        return filtered
+    
+    @staticmethod
+    def preprocess(data: np.ndarray, threshold: Optional[float] = None) -> np.ndarray:
+        """
+        Normalize the data and apply noise reduction in one step.
+        
+        Equivalent to remove_noise(normalize_data(data), threshold), but the
+        threshold is applied to the normalized buffer in place instead of
+        allocating a second output array.
         
-        return np.where(data < threshold, 0, data) 
\ No newline at end of file
+        Args:
+            data: Input satellite data array
+            threshold: Optional threshold value (on the normalized scale)
+            
+        Returns:
+            numpy.ndarray: Normalized, filtered data
+        """
+        normalized = SatellitePreprocessor.normalize_data(data)
+        return SatellitePreprocessor.remove_noise(normalized, threshold, inplace=True)
@@ -1,25 +1,104 @@
 import unittest
+import json
+import tempfile
 import numpy as np
+import pandas as pd
+import geopandas as gpd
 from pathlib import Path
-from src.data_handler import SatelliteDataHandler
+from src.data_handler import GeoAnalyzer, _sample_skewness
+
+class TestGeoAnalyzer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # One scratch directory shared by every test in the class
+        cls._tmp_dir = tempfile.TemporaryDirectory()
+        cls.tmp_path = Path(cls._tmp_dir.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp_dir.cleanup()
 
-class TestSatelliteDataHandler(unittest.TestCase):
     def setUp(self):
-        self.handler = SatelliteDataHandler()
-    
-    def test_save_to_csv(self):
-        # Create test data
-        test_data = np.random.rand(10, 10)
-        output_path = Path("test_output.csv")
-        
-        # Test saving to CSV
-        self.handler.save_to_csv(test_data, output_path)
-        
-        # Verify file exists
-        self.assertTrue(output_path.exists())
-        
-        # Clean up
-        output_path.unlink()
+        self.analyzer = GeoAnalyzer()
+        # Seeded generator so test data is reproducible
+        self.rng = np.random.default_rng(0)
+
+    def _write_geojson(self, name, count):
+        """Write a small point dataset and return its path"""
+        lons = self.rng.uniform(-74.1, -73.9, count)
+        lats = self.rng.uniform(40.6, 40.8, count)
+        populations = self.rng.integers(100, 1000, count)
+        features = [
+            {
+                "type": "Feature",
+                "properties": {
+                    "name": f"Location {i}",
+                    "attributes": "cafe",
+                    "population": int(population)
+                },
+                "geometry": {"type": "Point", "coordinates": [float(lon), float(lat)]}
+            }
+            for i, (lon, lat, population) in enumerate(zip(lons, lats, populations))
+        ]
+        path = self.tmp_path / name
+        path.write_text(json.dumps({"type": "FeatureCollection", "features": features}))
+        return path
+
+    def test_load_data(self):
+        path = self._write_geojson("locations.geojson", 10)
+
+        self.assertTrue(self.analyzer.load_data(str(path)))
+        self.assertEqual(len(self.analyzer.data), 10)
+        self.assertIn('population', self.analyzer.numeric_columns)
+
+    def test_load_data_missing_file(self):
+        missing_path = self.tmp_path / "missing.geojson"
+
+        self.assertFalse(self.analyzer.load_data(str(missing_path)))
+        self.assertIsNone(self.analyzer.data)
+
+    def _set_population(self, values):
+        """Attach a two-point dataset with the given population column"""
+        self.analyzer.data = gpd.GeoDataFrame(
+            {'population': values},
+            geometry=gpd.points_from_xy([-74.0, -73.9], [40.7, 40.8])
+        )
+
+    def test_demographic_population_integer_column(self):
+        # int32 counts whose total only fits in int64
+        self._set_population(np.array([2**31 - 1, 10], dtype=np.int32))
+        total = self.analyzer._fetch_demographic_data("test")['current_population']
+
+        self.assertEqual(total, 2**31 + 9)
+
+    def test_demographic_population_float_column_with_nan(self):
+        self._set_population([1.7, np.nan])
+        total = self.analyzer._fetch_demographic_data("test")['current_population']
+
+        self.assertAlmostEqual(total, 1.7)
+
+class TestSampleSkewness(unittest.TestCase):
+    def _assert_matches_pandas(self, values):
+        expected = pd.Series(values).skew()
+        result = _sample_skewness(values, values.mean())
+        if np.isnan(expected):
+            self.assertTrue(np.isnan(result))
+        else:
+            self.assertAlmostEqual(result, expected, places=10)
+
+    def test_random_data(self):
+        rng = np.random.default_rng(0)
+        self._assert_matches_pandas(rng.exponential(size=200))
+        self._assert_matches_pandas(rng.normal(size=50))
+
+    def test_constant_data(self):
+        self._assert_matches_pandas(np.full(20, 500.0))
+        self.assertEqual(_sample_skewness(np.full(20, 500.0), 500.0), 0.0)
+
+    def test_too_few_values(self):
+        values = np.array([100.0, 200.0])
+        self._assert_matches_pandas(values)
+        self.assertTrue(np.isnan(_sample_skewness(values, values.mean())))
 
 if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+import numpy as np
+from src.preprocessor import SatellitePreprocessor
+
+class TestSatellitePreprocessor(unittest.TestCase):
+    def setUp(self):
+        # Seeded generator so test data is reproducible
+        self.rng = np.random.default_rng(0)
+
+    def _sample_inputs(self):
+        """Return the same tile as float32, float64 and integer arrays"""
+        values = self.rng.normal(100, 20, (32, 32))
+        return [values.astype(np.float32), values, values.astype(np.int64)]
+
+    def test_preprocess_matches_separate_steps(self):
+        for data in self._sample_inputs():
+            with self.subTest(dtype=data.dtype):
+                expected = SatellitePreprocessor.remove_noise(
+                    SatellitePreprocessor.normalize_data(data)
+                )
+                result = SatellitePreprocessor.preprocess(data)
+
+                self.assertEqual(result.dtype, expected.dtype)
+                self.assertTrue(np.array_equal(result, expected))
+
+    def test_remove_noise_leaves_input_untouched(self):
+        for data in self._sample_inputs():
+            with self.subTest(dtype=data.dtype):
+                original = data.copy()
+                threshold = np.percentile(data, 25)
+                filtered = SatellitePreprocessor.remove_noise(data, threshold, inplace=False)
+
+                self.assertTrue(np.array_equal(data, original))
+                self.assertTrue(np.all(filtered[original < threshold] == 0))
+
+    def test_remove_noise_inplace_modifies_input(self):
+        data = self.rng.normal(100, 20, (32, 32))
+        threshold = np.percentile(data, 25)
+        filtered = SatellitePreprocessor.remove_noise(data, threshold, inplace=True)
+
+        self.assertIs(filtered, data)
+        self.assertFalse(np.any((data < threshold) & (data != 0)))
+
+if __name__ == '__main__':
+    unittest.main()